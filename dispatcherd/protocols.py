@@ -101,6 +101,8 @@ class PoolWorker(Protocol):
     and control its task processing lifecycle.
     """
 
+    __slots__ = ()  # so that implementations can use __slots__
+
     current_task: Optional[dict]
     worker_id: int
 
@@ -148,11 +150,24 @@ class WorkerData(Protocol):
     """
 
     management_lock: asyncio.Lock
+    worker_exited: asyncio.Condition
 
     def __iter__(self) -> Iterator[PoolWorker]: ...
 
     def get_by_id(self, worker_id: int) -> PoolWorker: ...
 
+    def get_free_worker(self) -> Optional[PoolWorker]:
+        """Return a worker that is ready and not running a task, if there is one"""
+        ...
+
+    def running_tasks(self) -> Iterator[dict]:
+        """Iterate the tasks that workers are currently running"""
+        ...
+
+    def is_running(self, signature: tuple) -> bool:
+        """Tells if a task with the given signature, from utils.task_signature, is running on any worker"""
+        ...
+
 
 class WorkerPool(Protocol):
     """
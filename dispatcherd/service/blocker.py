@@ -1,40 +1,47 @@
 import logging
-from typing import Iterable, Iterator, Optional
+from collections import Counter
+from typing import Iterator, Optional
 
 from ..protocols import Blocker as BlockerProtocol
-from ..utils import DuplicateBehavior
+from ..utils import DuplicateBehavior, task_signature
 from .queuer import Queuer
 
 logger = logging.getLogger(__name__)
 
+PARALLEL = DuplicateBehavior.parallel.value
+
 
 class Blocker(BlockerProtocol):
     def __init__(self, queuer: Queuer) -> None:
-        self.blocked_messages: list[dict] = []  # TODO: use deque, customizability
+        # Held messages with their signature, so it is computed once per message, see utils.task_signature
+        self.blocked_messages: list[tuple[tuple, dict]] = []  # TODO: use deque, customizability
+        self.blocked_signatures: Counter[tuple] = Counter()  # kept in sync with blocked_messages
         self.queuer = queuer
         self.discard_count: int = 0
         self.shutting_down: bool = False
 
     def __iter__(self) -> Iterator[dict]:
-        return iter(self.blocked_messages)
-
-    def _duplicate_in_list(self, message: dict, task_iter: Iterable[dict]) -> bool:
-        for other_message in task_iter:
-            if other_message is message:
-                continue
-            keys = ('task', 'args', 'kwargs')
-            if all(other_message.get(key) == message.get(key) for key in keys):
-                return True
-        return False
+        return (message for _, message in self.blocked_messages)
 
     def already_running(self, message: dict) -> bool:
-        return self._duplicate_in_list(message, self.queuer.running_tasks())
+        return self.queuer.workers.is_running(task_signature(message))
 
     def already_queued(self, message: dict) -> bool:
-        return self._duplicate_in_list(message, self.blocked_messages)
+        "Tells if a duplicate of a message, which is not itself blocked, is being held in the blocked messages"
+        return bool(self.blocked_signatures[task_signature(message)] > 0)
+
+    def block_task(self, message: dict) -> None:
+        signature = task_signature(message)
+        self.blocked_messages.append((signature, message))
+        self.blocked_signatures[signature] += 1
 
     def remove_task(self, message: dict) -> None:
-        self.blocked_messages.remove(message)
+        for i, (signature, blocked_message) in enumerate(self.blocked_messages):
+            if blocked_message == message:
+                del self.blocked_messages[i]
+                self.blocked_signatures[signature] -= 1
+                return
+        raise ValueError('Blocker.remove_task(message): message not in blocked messages')
 
     def process_task(self, message: dict) -> Optional[dict]:
         """If task is blocked, it is consumed here and None is returned, if not blocked, return message as-is
@@ -43,17 +50,20 @@ class Blocker(BlockerProtocol):
         If task if not blocked and is returned, that means you should continue doing what you were going to do.
         """
         uuid = message.get("uuid", "<unknown>")
-        on_duplicate = message.get('on_duplicate', DuplicateBehavior.parallel.value)
 
         if self.shutting_down:
-            logger.info(f'Not starting task (uuid={uuid}) because we are shutting down, queued_ct={len(self.blocked_messages)}')
-            self.blocked_messages.append(message)
+            logger.info(f'Not starting task (uuid={uuid}) because we are shutting down, queued_ct={self.count()}')
+            self.block_task(message)
             return None
 
+        on_duplicate = message.get('on_duplicate')
+        if on_duplicate is None or on_duplicate == PARALLEL:
+            return message  # the default, nothing can block it so skip the duplicate checks
+
         if on_duplicate == DuplicateBehavior.serial.value:
             if self.already_running(message):
-                logger.info(f'Queuing task (uuid={uuid}) because it is already running, queued_ct={len(self.blocked_messages)}')
-                self.blocked_messages.append(message)
+                logger.info(f'Queuing task (uuid={uuid}) because it is already running, queued_ct={self.count()}')
+                self.block_task(message)
                 return None
 
         elif on_duplicate == DuplicateBehavior.discard.value:
@@ -68,22 +78,29 @@ class Blocker(BlockerProtocol):
                 self.discard_count += 1
                 return None
             elif self.already_running(message):
-                logger.info(f'Queuing task (uuid={uuid}) because it is already running, queued_ct={len(self.blocked_messages)}')
-                self.blocked_messages.append(message)
+                logger.info(f'Queuing task (uuid={uuid}) because it is already running, queued_ct={self.count()}')
+                self.block_task(message)
                 return None
 
-        elif on_duplicate != DuplicateBehavior.parallel.value:
+        else:
             logger.warning(f'Got unexpected on_duplicate value {on_duplicate} in message {message}')
 
         return message
 
     def pop_unblocked_messages(self) -> list[dict]:
+        if not self.blocked_messages:
+            return []
         now_unblocked = []
-        for message in self.blocked_messages.copy():
+        still_blocked = []
+        for signature, message in self.blocked_messages:
             # All forms of blocking require task to not be running or queued in order to release
-            if not (self.already_running(message) or self.already_queued(message)):
+            # the message counts itself in blocked_signatures, so another blocked duplicate means a count above 1
+            if self.queuer.workers.is_running(signature) or self.blocked_signatures[signature] > 1:
+                still_blocked.append((signature, message))
+            else:
                 now_unblocked.append(message)
-                self.blocked_messages.remove(message)
+                self.blocked_signatures[signature] -= 1
+        self.blocked_messages = still_blocked
         return now_unblocked
 
     def count(self) -> int:
@@ -92,5 +109,5 @@ class Blocker(BlockerProtocol):
     def shutdown(self) -> None:
         self.shutting_down = True
         if self.blocked_messages:
-            uuids = [message.get('uuid', '<unknown>') for message in self.blocked_messages]
+            uuids = [message.get('uuid', '<unknown>') for message in self]
             logger.error(f'Dispatcherd shut down with blocked work, uuids: {uuids}')
@@ -25,7 +25,7 @@ async def _find_tasks(dispatcher: DispatcherMain, data: dict, cancel: bool = Fal
     "Utility method used for both running and cancel control methods"
     ret = {}
     for worker in dispatcher.pool.workers:
-        if worker.current_task:
+        if worker.current_task is not None:
             if task_filter_match(worker.current_task, data):
                 if cancel:
                     logger.warning(f'Canceling task in worker {worker.worker_id}, task: {worker.current_task}')
@@ -12,6 +12,8 @@ logger = logging.getLogger(__name__)
 class HasWakeup:
     """A mixin to indicate that this class gives a future timestamp of when a call is needed"""
 
+    __slots__ = ()  # so that subclasses can use __slots__
+
     @abstractmethod
     def next_wakeup(self) -> Optional[float]:
         """The next time that we need to call the callback for, outline of contract:
@@ -111,16 +113,14 @@ class NextWakeupRunner:
 
         This needs to be called if objects in wakeup_objects are changed, for example
         """
+        if self.asyncio_task and not self.asyncio_task.done():
+            # The running task will re-check all objects when it wakes up, no need to check them here too
+            self.kick_event.set()
+            return
         if await self.process_wakeups(current_time=time.monotonic(), do_processing=False) is None:
-            # Optimization here, if there is no next time, do not bother managing tasks
+            # Optimization here, if there is no next time, do not bother starting a task
             return
-        if self.asyncio_task:
-            if self.asyncio_task.done():
-                self.mk_new_task()
-            else:
-                self.kick_event.set()
-        else:
-            self.mk_new_task()
+        self.mk_new_task()
 
     def all_tasks(self) -> list[asyncio.Task]:
         if self.asyncio_task:
@@ -3,11 +3,13 @@ import logging
 import os
 import signal
 import time
-from typing import Any, Iterator, Literal, Optional
+from collections import Counter
+from typing import Any, Callable, Iterator, Literal, Optional, Union
 
 from ..protocols import PoolWorker as PoolWorkerProtocol
 from ..protocols import WorkerData as WorkerDataProtocol
 from ..protocols import WorkerPool as WorkerPoolProtocol
+from ..utils import task_signature
 from .asyncio_tasks import ensure_fatal
 from .blocker import Blocker
 from .next_wakeup_runner import HasWakeup, NextWakeupRunner
@@ -16,28 +18,85 @@ from .queuer import Queuer
 
 logger = logging.getLogger(__name__)
 
+# Bound once for PoolWorker.cancel, which is on the task timeout path
+_os_kill = os.kill
+_SIGUSR1 = signal.SIGUSR1
+
+
+WorkerStatus = Literal['initialized', 'spawned', 'starting', 'ready', 'stopping', 'exited', 'error', 'retired']
+
+# Sets, so that membership is a hash lookup for the per-worker checks
+CAPACITY_STATUSES: frozenset[WorkerStatus] = frozenset(('initialized', 'spawned', 'starting', 'ready'))
+INACTIVE_STATUSES: frozenset[WorkerStatus] = frozenset(('exited', 'error', 'initialized'))
+# Statuses that have a stop or removal deadline for manage_old_workers
+DEADLINE_STATUSES: frozenset[WorkerStatus] = frozenset(('stopping', 'retired', 'error'))
+# Statuses where the process is not expected to be alive, so manage_old_workers does not check it
+NOT_RUNNING_STATUSES: frozenset[WorkerStatus] = frozenset(('retired', 'error', 'exited', 'initialized', 'spawned'))
+
 
 class PoolWorker(HasWakeup, PoolWorkerProtocol):
+    __slots__ = (
+        'worker_data',
+        'worker_id',
+        'process',
+        '_current_task',
+        'current_signature',
+        'created_at',
+        'started_at',
+        'timeout_at',
+        'stopping_at',
+        'retired_at',
+        'is_active_cancel',
+        'finished_count',
+        '_status',
+    )
+
     def __init__(self, worker_id: int, process: ProcessProxy) -> None:
+        # Set by WorkerData when this worker is added, it keeps counts in sync with status and current_task
+        self.worker_data: Optional['WorkerData'] = None
         self.worker_id = worker_id
         self.process = process
-        self.current_task: Optional[dict] = None
+        self._current_task: Optional[dict] = None
+        self.current_signature: Optional[tuple] = None  # signature of current_task, see utils.task_signature
         self.created_at: float = time.monotonic()
         self.started_at: Optional[float] = None
+        self.timeout_at: Optional[float] = None  # when the current task times out, if it has a timeout
         self.stopping_at: Optional[float] = None
         self.retired_at: Optional[float] = None
         self.is_active_cancel: bool = False
 
         # Tracking information for worker
         self.finished_count = 0
-        self.status: Literal['initialized', 'spawned', 'starting', 'ready', 'stopping', 'exited', 'error', 'retired'] = 'initialized'
-        self.exit_msg_event = asyncio.Event()
+        self._status: WorkerStatus = 'initialized'
+
+    @property
+    def status(self) -> WorkerStatus:
+        return self._status
+
+    @status.setter
+    def status(self, value: WorkerStatus) -> None:
+        old_status, self._status = self._status, value
+        if self.worker_data is not None:
+            self.worker_data.status_changed(self, old_status)
+
+    @property
+    def current_task(self) -> Optional[dict]:
+        return self._current_task
+
+    @current_task.setter
+    def current_task(self, value: Optional[dict]) -> None:
+        old_signature = self.current_signature
+        self._current_task = value
+        self.current_signature = None if value is None else task_signature(value)
+        if self.worker_data is not None:
+            self.worker_data.current_task_changed(self, old_signature)
 
     def is_ready(self) -> bool:
         """Worker is ready to receive task requests"""
         return bool(self.status == 'ready')
 
-    async def start(self) -> None:
+    async def start(self, on_exit: Optional[Callable[[], None]] = None) -> None:
+        "Fork the subprocess, on_exit is called from the event loop when it exits for any reason"
         if self.status != 'initialized':
             logger.error(f'Worker {self.worker_id} status is not initialized, can not start, status={self.status}')
             return
@@ -48,27 +107,37 @@ class PoolWorker(HasWakeup, PoolWorkerProtocol):
             logger.exception(f'Unexpected error starting worker {self.worker_id} subprocess, marking as error')
             self.status = 'error'
             return
+        if on_exit is not None:
+            self.process.watch_exit(on_exit)
         logger.debug(f'Worker {self.worker_id} pid={self.process.pid} subprocess has spawned')
         self.status = 'starting'  # Not ready until it sends callback message
 
     @property
     def counts_for_capacity(self) -> bool:
-        return bool(self.status in ('initialized', 'spawned', 'starting', 'ready'))
+        return bool(self.status in CAPACITY_STATUSES)
 
     async def start_task(self, message: dict) -> None:
         self.current_task = message  # NOTE: this marks this worker as busy
         self.process.message_queue.put(message)
         self.started_at = time.monotonic()
+        timeout = message.get('timeout')
+        self.timeout_at = (self.started_at + timeout) if timeout else None
+
+    async def join(self, timeout: float = 3) -> None:
+        """Wait for the worker process to exit, without blocking the event loop
 
-    async def join(self, timeout: int = 3) -> None:
+        The is_alive check also reaps the process once it has exited.
+        """
         logger.debug(f'Joining worker {self.worker_id} pid={self.process.pid} subprocess')
-        self.process.join(timeout)  # argument is timeout
+        deadline = time.monotonic() + timeout
+        while self.process.is_alive() and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
 
     async def signal_stop(self) -> None:
         "Tell the worker to stop and return"
         self.process.message_queue.put("stop")
         logger.debug(f'Sent stop message to worker_id={self.worker_id}')
-        if self.current_task:
+        if self.current_task is not None:
             uuid = self.current_task.get('uuid', '<unknown>')
             logger.warning(f'Worker {self.worker_id} is currently running task (uuid={uuid}), canceling for shutdown')
             self.cancel()
@@ -85,8 +154,7 @@ class PoolWorker(HasWakeup, PoolWorkerProtocol):
 
         try:
             if self.status != 'exited':
-                await asyncio.wait_for(self.exit_msg_event.wait(), timeout=3)
-            self.exit_msg_event.clear()
+                await asyncio.wait_for(self.wait_for_exit(), timeout=3)
         except asyncio.TimeoutError:
             logger.error(f'Worker {self.worker_id} pid={self.process.pid} failed to send exit message in 3 seconds')
             self.status = 'error'  # can signal for result task to exit, since no longer waiting for it here
@@ -96,8 +164,8 @@ class PoolWorker(HasWakeup, PoolWorkerProtocol):
         for i in range(3):
             if self.process.is_alive():
                 logger.error(f'Worker {self.worker_id} pid={self.process.pid} is still alive trying SIGKILL, attempt {i}')
-                await asyncio.sleep(1)
                 self.process.kill()
+                await self.join(timeout=1)
             else:
                 logger.debug(f'Worker {self.worker_id} pid={self.process.pid} exited code={self.process.exitcode()}')
                 self.status = 'retired'
@@ -109,22 +177,32 @@ class PoolWorker(HasWakeup, PoolWorkerProtocol):
         self.retired_at = time.monotonic()
         return
 
+    async def wait_for_exit(self) -> None:
+        "Wait until the results task has processed the shutdown message from this worker"
+        assert self.worker_data is not None  # only workers in the pool get their exit message processed
+        worker_exited = self.worker_data.worker_exited
+        async with worker_exited:
+            await worker_exited.wait_for(lambda: self.status == 'exited')
+
     def cancel(self) -> None:
+        if self.is_active_cancel:
+            return  # already signaled, another SIGUSR1 could interrupt the worker while it reports the cancel
         self.is_active_cancel = True  # signal for result callback
 
         # If the process has never been started or is already gone, its pid may be None
         if self.process.pid is None:
             return  # it's effectively already canceled/not running
-        os.kill(self.process.pid, signal.SIGUSR1)  # Use SIGUSR1 instead of SIGTERM
+        _os_kill(self.process.pid, _SIGUSR1)  # Use SIGUSR1 instead of SIGTERM
 
     def get_data(self) -> dict[str, Any]:
+        task = self._current_task
         return {
             'worker_id': self.worker_id,
             'pid': self.process.pid,
-            'status': self.status,
+            'status': self._status,
             'finished_count': self.finished_count,
-            'current_task': self.current_task.get('task') if self.current_task else None,
-            'current_task_uuid': self.current_task.get('uuid', '<unknown>') if self.current_task else None,
+            'current_task': task.get('task') if task else None,
+            'current_task_uuid': task.get('uuid', '<unknown>') if task else None,
             'active_cancel': self.is_active_cancel,
             'age': time.monotonic() - self.created_at,
         }
@@ -133,36 +211,53 @@ class PoolWorker(HasWakeup, PoolWorkerProtocol):
         self.is_active_cancel = False
         self.current_task = None
         self.started_at = None
+        self.timeout_at = None
         self.finished_count += 1
 
     @property
     def inactive(self) -> bool:
         "Return True if no further shutdown or callback messages are expected from this worker"
-        return self.status in ['exited', 'error', 'initialized']
+        return self.status in INACTIVE_STATUSES
 
     def next_wakeup(self) -> Optional[float]:
         """Used by next-run-runner for setting wakeups for task timeouts"""
         if self.is_active_cancel:
             return None
-        if self.current_task and self.current_task.get('timeout') and self.started_at:
-            return self.started_at + self.current_task['timeout']
-        return None
+        return self.timeout_at
 
 
 class PoolEvents:
     "Benchmark tests have to re-create this because they use same object in different event loops"
 
+    __slots__ = ('queue_cleared', 'work_cleared', 'management_event', 'workers_ready', 'message_received', 'management_reasons')
+
     def __init__(self) -> None:
         self.queue_cleared: asyncio.Event = asyncio.Event()  # queue is now 0 length
         self.work_cleared: asyncio.Event = asyncio.Event()  # Totally quiet, no blocked or queued messages, no busy workers
         self.management_event: asyncio.Event = asyncio.Event()  # Process spawning is backgrounded, so this is the kicker
         self.workers_ready: asyncio.Event = asyncio.Event()  # min workers have started and sent ready message
+        self.message_received: asyncio.Event = asyncio.Event()  # a message was dispatched, received_count changed, waiters clear it
+        self.management_reasons: set[str] = set()  # why management_event was set, cleared along with it
+
+    def kick_management(self, reason: str) -> None:
+        "Wake the management task, kicks that come before it wakes up are handled in one pass"
+        self.management_reasons.add(reason)
+        self.management_event.set()
 
 
 class WorkerData(WorkerDataProtocol):
     def __init__(self) -> None:
         self.workers: dict[int, PoolWorker] = {}
         self.management_lock = asyncio.Lock()
+        # Shared by all workers, notified when any worker sends its shutdown message
+        self.worker_exited = asyncio.Condition(self.management_lock)
+
+        # Counts are updated by the workers as their status and current_task change,
+        # so that the pool never has to scan all workers to count them
+        self.status_counts: Counter[str] = Counter()
+        self.busy_worker_ids: set[int] = set()  # workers with a current task
+        self.running_signatures: Counter[tuple] = Counter()  # see utils.task_signature
+        self.free_worker_ids: set[int] = set()  # ready workers with no current task
 
     def __iter__(self) -> Iterator[PoolWorker]:
         return iter(self.workers.values())
@@ -175,12 +270,79 @@ class WorkerData(WorkerDataProtocol):
 
     def add_worker(self, worker: PoolWorker) -> None:
         self.workers[worker.worker_id] = worker
+        worker.worker_data = self
+        self.status_counts[worker.status] += 1
+        if worker.current_signature is not None:
+            self.busy_worker_ids.add(worker.worker_id)
+            self.running_signatures[worker.current_signature] += 1
+        self._update_free(worker)
 
     def get_by_id(self, worker_id: int) -> PoolWorker:
         return self.workers[worker_id]
 
     def remove_by_id(self, worker_id: int) -> None:
-        del self.workers[worker_id]
+        worker = self.workers.pop(worker_id)
+        worker.worker_data = None
+        worker.process.unwatch_exit()
+        self.status_counts[worker.status] -= 1
+        if worker.current_signature is not None:
+            self.busy_worker_ids.discard(worker_id)
+            self.running_signatures[worker.current_signature] -= 1
+        self.free_worker_ids.discard(worker_id)
+
+    def _update_free(self, worker: PoolWorker) -> None:
+        if worker.current_task is None and worker.is_ready():
+            self.free_worker_ids.add(worker.worker_id)
+        else:
+            self.free_worker_ids.discard(worker.worker_id)
+
+    def status_changed(self, worker: PoolWorker, old_status: str) -> None:
+        self.status_counts[old_status] -= 1
+        self.status_counts[worker.status] += 1
+        self._update_free(worker)
+
+    def current_task_changed(self, worker: PoolWorker, old_signature: Optional[tuple]) -> None:
+        if old_signature is not None:
+            self.busy_worker_ids.discard(worker.worker_id)
+            self.running_signatures[old_signature] -= 1
+        if worker.current_signature is not None:
+            self.busy_worker_ids.add(worker.worker_id)
+            self.running_signatures[worker.current_signature] += 1
+        self._update_free(worker)
+
+    def get_free_worker(self) -> Optional[PoolWorker]:
+        for worker_id in self.free_worker_ids:
+            return self.workers[worker_id]
+        return None
+
+    def is_running(self, signature: tuple) -> bool:
+        return bool(self.running_signatures[signature] > 0)
+
+    def running_tasks(self) -> Iterator[dict]:
+        for worker_id in self.busy_worker_ids:
+            task = self.workers[worker_id].current_task
+            if task is not None:  # for typing, busy workers always have a task
+                yield task
+
+    @property
+    def running_count(self) -> int:
+        return len(self.busy_worker_ids)
+
+    def count_with_status(self, statuses: frozenset[WorkerStatus]) -> int:
+        return sum(self.status_counts[status] for status in statuses)
+
+    @property
+    def capacity_count(self) -> int:
+        "Number of workers that are running or expected to run soon, see PoolWorker.counts_for_capacity"
+        return self.count_with_status(CAPACITY_STATUSES)
+
+    @property
+    def all_ready(self) -> bool:
+        return bool(self.status_counts['ready'] == len(self.workers))
+
+    @property
+    def all_inactive(self) -> bool:
+        return bool(self.count_with_status(INACTIVE_STATUSES) == len(self.workers))
 
 
 class WorkerPool(WorkerPoolProtocol):
@@ -200,6 +362,9 @@ class WorkerPool(WorkerPoolProtocol):
 
         # internal asyncio tasks
         self.read_results_task: Optional[asyncio.Task] = None
+        # messages from workers, forwarded from the process manager finished_queue by a reader thread
+        self.finished_messages: asyncio.Queue[Union[str, dict]] = asyncio.Queue()
+        self.results_batch_size = 64
         self.management_task: Optional[asyncio.Task] = None
         # other internal asyncio objects
         self.events: PoolEvents = PoolEvents()
@@ -214,6 +379,7 @@ class WorkerPool(WorkerPoolProtocol):
 
         # the timeout runner keeps its own task
         self.timeout_runner = NextWakeupRunner(self.workers, self.cancel_worker, name='worker_timeout_manager')
+        self.timeout_kick_pending = False
 
         # Track the last time we used X number of workers, like
         # {
@@ -239,23 +405,20 @@ class WorkerPool(WorkerPoolProtocol):
 
     @property
     def received_count(self) -> int:
-        return self.processed_count + self.queuer.count() + self.blocker.count() + sum(1 for w in self.workers if w.current_task)
+        return self.processed_count + self.queuer.count() + self.blocker.count() + self.workers.running_count
 
     async def start_working(self, forking_lock: asyncio.Lock, exit_event: Optional[asyncio.Event] = None) -> None:
+        self.process_manager.start_finished_reader(self.finished_messages)
         self.read_results_task = ensure_fatal(asyncio.create_task(self.read_results_forever(), name='results_task'), exit_event=exit_event)
         self.management_task = ensure_fatal(asyncio.create_task(self.manage_workers(forking_lock=forking_lock), name='management_task'), exit_event=exit_event)
         self.timeout_runner.exit_event = exit_event
 
     def get_running_count(self) -> int:
-        ct = 0
-        for worker in self.workers:
-            if worker.current_task:
-                ct += 1
-        return ct
+        return self.workers.running_count
 
     def should_scale_down(self) -> bool:
         "If True, we have not had enough work lately to justify the number of workers we are running"
-        worker_ct = len([worker for worker in self.workers if worker.counts_for_capacity])
+        worker_ct = self.workers.capacity_count
         last_used = self.last_used_by_ct.get(worker_ct)
         if last_used:
             delta = time.monotonic() - last_used
@@ -271,8 +434,7 @@ class WorkerPool(WorkerPoolProtocol):
         Instead of fully decomissioning a worker for scale-down, it just sends a stop message.
         Later on, we will reconcile data to get the full decomissioning outcome.
         """
-        available_workers = [worker for worker in self.workers if worker.counts_for_capacity]
-        worker_ct = len(available_workers)
+        worker_ct = self.workers.capacity_count
 
         if worker_ct < self.min_workers:
             # Scale up to MIN for startup, or scale _back_ up to MIN if workers exited due to external signals
@@ -282,7 +444,7 @@ class WorkerPool(WorkerPoolProtocol):
                 worker_ids.append(new_worker_id)
             logger.info(f'Starting subprocess for workers ids={worker_ids} (prior ct={worker_ct}) to satisfy min_workers')
 
-        elif self.active_task_ct() > len(available_workers):
+        elif self.active_task_ct() > worker_ct:
             # have more messages to process than what we have workers
             if worker_ct < self.max_workers:
                 # Scale up, below or to MAX
@@ -296,11 +458,14 @@ class WorkerPool(WorkerPoolProtocol):
             # Scale down above or to MIN, because surplus of workers have done nothing useful in <cutoff> time
             async with self.workers.management_lock:
                 if self.should_scale_down():
-                    for worker in available_workers:
-                        if worker.current_task is None:
+                    for worker in self.workers:
+                        if worker.counts_for_capacity and worker.current_task is None:
                             logger.info(f'Scaling down worker id={worker.worker_id} (prior ct={worker_ct}) due to demand')
                             await worker.signal_stop()
                             break
+                    else:
+                        # No idle worker to retire, so all of them are in use right now
+                        self.last_used_by_ct[worker_ct] = time.monotonic()
 
     async def manage_new_workers(self, forking_lock: asyncio.Lock) -> None:
         """This calls the .start() method to actually fork a new process for initialized workers
@@ -311,7 +476,7 @@ class WorkerPool(WorkerPoolProtocol):
         for worker in self.workers:
             if worker.status == 'initialized':
                 async with forking_lock:  # never fork while connecting
-                    await worker.start()
+                    await worker.start(on_exit=self.worker_process_exited)
                 # Starting the worker may have freed capacity for queued work
                 await self.drain_queue()
 
@@ -331,13 +496,14 @@ class WorkerPool(WorkerPoolProtocol):
         async with self.workers.management_lock:
             current_workers = list(self.workers)
 
-        remove_ids = []
+        remove_ids: list[int] = []
+        now = time.monotonic()  # one clock read for the scan, stops awaited below can only make deadlines look later
         for worker in current_workers:
             # Check if the worker has died unexpectedly.
-            if worker.status not in ['retired', 'error', 'exited', 'initialized', 'spawned'] and not worker.process.is_alive():
+            if worker.status not in NOT_RUNNING_STATUSES and not worker.process.is_alive():
                 logger.error(f'Worker {worker.worker_id} pid={worker.process.pid} has died unexpectedly, status was {worker.status}')
 
-                if worker.current_task:
+                if worker.current_task is not None:
                     uuid = worker.current_task.get('uuid', '<unknown>')
                     logger.error(f'Task (uuid={uuid}) was running on worker {worker.worker_id} but the worker died unexpectedly')
                     self.canceled_count += 1
@@ -347,37 +513,85 @@ class WorkerPool(WorkerPoolProtocol):
 
             if worker.status == 'exited':
                 await worker.stop()  # happy path
-            elif worker.status == 'stopping' and worker.stopping_at and (time.monotonic() - worker.stopping_at) > self.worker_stop_wait:
+            elif worker.status == 'stopping' and worker.stopping_at and (now - worker.stopping_at) > self.worker_stop_wait:
                 logger.warning(f'Worker id={worker.worker_id} failed to respond to stop signal')
                 await worker.stop()  # agressively bring down process
-            elif worker.status in ['retired', 'error'] and worker.retired_at and (time.monotonic() - worker.retired_at) > self.worker_removal_wait:
+            elif worker.status in ('retired', 'error') and worker.retired_at and (now - worker.retired_at) > self.worker_removal_wait:
                 remove_ids.append(worker.worker_id)
 
         # Phase 2: Remove workers from the collection under lock.
+        if not remove_ids:
+            return
         async with self.workers.management_lock:
             for worker_id in remove_ids:
                 if worker_id in self.workers:
                     logger.debug(f'Fully removing worker id={worker_id}')
                     self.workers.remove_by_id(worker_id)
 
+    def next_management_timeout(self, now: Optional[float] = None, handled_at: Optional[float] = None) -> float:
+        """Seconds until the next stop, removal, or scale-down deadline that manage_workers needs to act on
+
+        Deadlines at or before handled_at (default now) were already due when the last management pass ran.
+        That pass acted on them, or could not act on them yet, so they do not wake management again.
+        This is capped at scaledown_interval, a fallback poll, since worker deaths already kick management when the process exits.
+        """
+        if now is None:
+            now = time.monotonic()
+        if handled_at is None:
+            handled_at = now
+        deadlines = []
+        # Usually no worker is stopping or being removed, the status counts tell us that without a scan
+        if self.workers.count_with_status(DEADLINE_STATUSES):
+            for worker in self.workers:
+                if worker.status == 'stopping' and worker.stopping_at:
+                    deadlines.append(worker.stopping_at + self.worker_stop_wait)
+                elif worker.status in ('retired', 'error') and worker.retired_at:
+                    deadlines.append(worker.retired_at + self.worker_removal_wait)
+
+        worker_ct = self.workers.capacity_count
+        if worker_ct > self.min_workers:
+            last_used = self.last_used_by_ct.get(worker_ct)
+            if last_used:
+                deadlines.append(last_used + self.scaledown_wait)
+
+        deadline = now + self.scaledown_interval
+        for worker_deadline in deadlines:
+            if handled_at < worker_deadline < deadline:
+                deadline = worker_deadline
+        return max(deadline - now, 0.0)
+
     async def manage_workers(self, forking_lock: asyncio.Lock) -> None:
         """Enforces worker policy like min and max workers, and later, auto scale-down"""
+        reasons: set[str] = set()  # empty means a full pass
+        deadline = 0.0
         while not self.shutting_down:
+            pass_started = time.monotonic()
 
             await self.scale_workers()
 
             await self.manage_new_workers(forking_lock)
 
-            await self.manage_old_workers()
+            # Queue pressure alone gives manage_old_workers nothing to do before its next deadline
+            if reasons != {'queue_pressure'} or time.monotonic() >= deadline:
+                await self.manage_old_workers()
+                deadline = float('inf')
+            now = time.monotonic()
+            deadline = min(deadline, now + self.next_management_timeout(now, handled_at=pass_started))
 
             try:
-                await asyncio.wait_for(self.events.management_event.wait(), timeout=self.scaledown_interval)
+                await asyncio.wait_for(self.events.management_event.wait(), timeout=max(deadline - now, 0.0))
+                reasons = set(self.events.management_reasons)
             except asyncio.TimeoutError:
-                pass
+                reasons = set()
             self.events.management_event.clear()
+            self.events.management_reasons.clear()
 
         logger.debug('Pool worker management task exiting')
 
+    def worker_process_exited(self) -> None:
+        "A worker subprocess ended, expected or not, let manage_old_workers handle it now rather than at its next poll"
+        self.events.kick_management('worker_exit')
+
     async def cancel_worker(self, worker: PoolWorker) -> None:
         """Writes a log and sends cancel signal to worker"""
         if (not worker.current_task) or (not worker.started_at):
@@ -417,6 +631,7 @@ class WorkerPool(WorkerPoolProtocol):
 
     async def force_shutdown(self) -> None:
         for worker in self.workers:
+            worker.process.unwatch_exit()
             if worker.process.pid and worker.process.is_alive():
                 logger.warning(f'Force killing worker {worker.worker_id} pid={worker.process.pid}')
                 worker.process.kill()
@@ -433,7 +648,7 @@ class WorkerPool(WorkerPoolProtocol):
         self.shutting_down = True
 
         # Shutting down the management task first reduces the number of tasks that might modify self.workers
-        self.events.management_event.set()
+        self.events.kick_management('shutdown')
         if self.management_task:
             try:
                 await asyncio.wait_for(self.management_task, timeout=self.shutdown_timeout)  # in happy path this should exit very fast
@@ -449,6 +664,8 @@ class WorkerPool(WorkerPoolProtocol):
         self.queuer.shutdown()
         self.blocker.shutdown()
         await self.stop_workers()
+        for worker in self.workers:
+            worker.process.unwatch_exit()  # nothing is left to manage, do not leave the sentinels registered on the loop
         self.process_manager.finished_queue.put('stop')
 
         if self.read_results_task:
@@ -467,56 +684,67 @@ class WorkerPool(WorkerPoolProtocol):
         "The number of tasks currently being ran, or immediently eligible to run"
         return self.get_running_count() + self.queuer.count()
 
+    async def kick_timeout_runner(self) -> None:
+        "Kick the timeout task once for all task starts and finishes since the last kick"
+        if self.timeout_kick_pending:
+            self.timeout_kick_pending = False
+            await self.timeout_runner.kick()
+
     async def post_task_start(self, message: dict) -> None:
         if 'timeout' in message:
-            await self.timeout_runner.kick()  # kick timeout task to set wakeup
+            self.timeout_kick_pending = True  # timeout task needs to set wakeup, see kick_timeout_runner
         running_ct = self.get_running_count()
         self.last_used_by_ct[running_ct] = None  # block scale down of this amount
 
-    async def dispatch_task(self, message: dict) -> None:
-        uuid = message.get("uuid", "<unknown>")
+    async def _dispatch_locked(self, message: dict) -> None:
+        "Body of dispatch_task, the caller must hold the management lock"
         unblocked_task = self.blocker.process_task(message)
         if unblocked_task:
-            worker = self.queuer.get_worker_or_process_task(unblocked_task)
+            worker = self.queuer.get_worker_or_process_task(unblocked_task)  # this logs the dispatch or the queuing
             if worker:
-                logger.debug(f"Dispatching task (uuid={uuid}) to worker (id={worker.worker_id})")
-                async with self.workers.management_lock:
-                    await worker.start_task(unblocked_task)
-                    await self.post_task_start(unblocked_task)
+                await worker.start_task(unblocked_task)
+                await self.post_task_start(unblocked_task)
             else:
-                self.events.management_event.set()  # kick manager task to start auto-scale up if needed
+                self.events.kick_management('queue_pressure')  # kick manager task to start auto-scale up if needed
 
-    async def drain_queue(self) -> None:
+    async def dispatch_task(self, message: dict) -> None:
         async with self.workers.management_lock:
-            # First move all unblocked tasks into the blocked-on-capacity queue
-            for message in self.blocker.pop_unblocked_messages():
-                self.queuer.queued_messages.append(message)
-
-        # Now process all messages we can in the unblocked queue
-        processed_queue = False
-        for message in self.queuer.queued_messages.copy():
-            if (not self.queuer.get_free_worker()) or self.shutting_down:
-                return
-            self.queuer.queued_messages.remove(message)
-            await self.dispatch_task(message)
-            processed_queue = True
+            await self._dispatch_locked(message)
+        self.events.message_received.set()
+        await self.kick_timeout_runner()
+
+    async def drain_queue(self) -> None:
+        # If nothing is waiting, do not contend for the lock
+        if self.queuer.queued_messages or self.blocker.count():
+            processed_queue = False
+            async with self.workers.management_lock:
+                # First move all unblocked tasks into the blocked-on-capacity queue
+                self.queuer.queued_messages.extend(self.blocker.pop_unblocked_messages())
 
-        if processed_queue:
-            self.events.queue_cleared.set()
+                # Now process all messages we can in the unblocked queue, in the same locked section
+                while self.queuer.queued_messages and (not self.shutting_down) and self.queuer.get_free_worker():
+                    message = self.queuer.queued_messages.popleft()
+                    await self._dispatch_locked(message)
+                    processed_queue = True
+
+            if processed_queue and not self.queuer.queued_messages:
+                self.events.queue_cleared.set()
+
+        await self.kick_timeout_runner()
 
     async def process_finished(self, worker: PoolWorker, message: dict) -> None:
-        uuid = message.get('uuid', '<unknown>')
-        msg = f"Worker {worker.worker_id} finished task (uuid={uuid}), ct={worker.finished_count}"
-        result = None
-        if message.get("result"):
-            result = message["result"]
-            if worker.is_active_cancel:
-                msg += ', expected cancel'
-            if result == '<cancel>':
-                msg += ', canceled'
-            else:
-                msg += f", result: {result}"
-        logger.debug(msg)
+        result = message.get("result")
+        if logger.isEnabledFor(logging.DEBUG):  # the result may be large, only format it if it will be logged
+            uuid = message.get('uuid', '<unknown>')
+            msg = f"Worker {worker.worker_id} finished task (uuid={uuid}), ct={worker.finished_count}"
+            if result:
+                if worker.is_active_cancel:
+                    msg += ', expected cancel'
+                if result == '<cancel>':
+                    msg += ', canceled'
+                else:
+                    msg += f", result: {result}"
+            logger.debug(msg)
 
         running_ct = self.get_running_count()
         self.last_used_by_ct[running_ct] = time.monotonic()  # scale down may be allowed, clock starting now
@@ -529,11 +757,11 @@ class WorkerPool(WorkerPoolProtocol):
                 self.finished_count += 1
             worker.mark_finished_task()
 
-        if not self.queuer.queued_messages and all(worker.current_task is None for worker in self.workers):
+        if not self.queuer.queued_messages and self.workers.running_count == 0:
             self.events.work_cleared.set()
 
         if 'timeout' in message:
-            await self.timeout_runner.kick()
+            self.timeout_kick_pending = True  # kicked once per results batch, when the queue is drained
 
     @property
     def status_counts(self) -> dict[str, int]:
@@ -542,53 +770,65 @@ class WorkerPool(WorkerPoolProtocol):
         example format:
         {'retired': 8, 'exited': 1, 'stopping': 3}
         """
-        stats: dict[str, int] = {}
-        for worker in self.workers:
-            stats.setdefault(worker.status, 0)
-            stats[worker.status] += 1
-        return stats
+        return {status: count for status, count in self.workers.status_counts.items() if count}
 
-    async def read_results_forever(self) -> None:
-        """Perpetual task that continuously waits for task completions."""
-        while True:
-            # Wait for a result from the finished queue
-            message = await self.process_manager.read_finished()
+    async def process_result(self, message: Union[str, dict]) -> bool:
+        """Handle one message from a worker, returns True if the results task should exit
 
-            if message == 'stop':
-                if self.shutting_down:
-                    logger.debug(f'Results message got administrative stop message, worker status: {self.status_counts}')
-                    return
-                else:
-                    logger.error('Results queue got stop message even through not shutting down')
-                    continue
+        Workers freed up by this message are given queued work by the caller, see drain_queue
+        """
+        if message == 'stop':
+            if self.shutting_down:
+                logger.debug(f'Results message got administrative stop message, worker status: {self.status_counts}')
+                return True
+            else:
+                logger.error('Results queue got stop message even through not shutting down')
+                return False
 
-            worker_id = int(message["worker"])
-            event = message["event"]
-            worker = self.workers.get_by_id(worker_id)
+        assert isinstance(message, dict)  # for typing, only the stop message is a string
+        worker_id = int(message["worker"])
+        event = message["event"]
+        worker = self.workers.get_by_id(worker_id)
 
-            if event == 'ready':
-                worker.status = 'ready'
-                if all(worker.status == 'ready' for worker in self.workers):
-                    self.events.workers_ready.set()
-                await self.drain_queue()
+        if event == 'ready':
+            worker.status = 'ready'
 
-            elif event == 'shutdown':
-                async with self.workers.management_lock:
-                    worker.status = 'exited'
-                    worker.exit_msg_event.set()
+        elif event == 'shutdown':
+            async with self.workers.management_lock:
+                worker.status = 'exited'
+                self.workers.worker_exited.notify_all()
 
-                if self.shutting_down:
-                    if all(worker.inactive for worker in self.workers):
-                        logger.debug(f"Worker {worker_id} exited and that is all of them, exiting results read task.")
-                        return
-                    else:
-                        logger.debug(
-                            f"Worker {worker_id} exited and that is a good thing because we are trying to shut down. Remaining statuses: {self.status_counts}"
-                        )
+            if self.shutting_down:
+                if self.workers.all_inactive:
+                    logger.debug(f"Worker {worker_id} exited and that is all of them, exiting results read task.")
+                    return True
                 else:
-                    self.events.management_event.set()
-                    logger.debug(f"Worker {worker_id} sent exit signal.")
+                    logger.debug(
+                        f"Worker {worker_id} exited and that is a good thing because we are trying to shut down. Remaining statuses: {self.status_counts}"
+                    )
+            else:
+                self.events.kick_management('exit')
+                logger.debug(f"Worker {worker_id} sent exit signal.")
 
-            elif event == 'done':
-                await self.process_finished(worker, message)
-                await self.drain_queue()
+        elif event == 'done':
+            await self.process_finished(worker, message)
+
+        return False
+
+    async def read_results_forever(self) -> None:
+        """Perpetual task that continuously waits for task completions."""
+        while True:
+            # Wait for a result from the finished queue, and take any others that have already arrived
+            messages = [await self.finished_messages.get()]
+            while len(messages) < self.results_batch_size and not self.finished_messages.empty():
+                messages.append(self.finished_messages.get_nowait())
+
+            for message in messages:
+                if await self.process_result(message):
+                    return
+
+            # Ready and done messages free up workers, hand out queued work once for the whole batch
+            await self.drain_queue()
+
+            if (not self.events.workers_ready.is_set()) and self.workers.all_ready:
+                self.events.workers_ready.set()
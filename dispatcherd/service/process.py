@@ -1,5 +1,6 @@
 import asyncio
 import multiprocessing
+import threading
 from multiprocessing.context import BaseContext
 from types import ModuleType
 from typing import Any, Callable, Iterable, Optional, Union
@@ -17,6 +18,7 @@ class ProcessProxy:
         target: Callable = work_loop,
         ctx: Union[BaseContext, ModuleType] = multiprocessing,
     ) -> None:
+        # A full Queue, so put() hands the pipe write to a feeder thread and never blocks the event loop on a stuck worker
         self.message_queue: multiprocessing.Queue = ctx.Queue()
         # This is intended use of multiprocessing context, but not available on BaseContext
         if kwargs is None:
@@ -25,10 +27,47 @@ class ProcessProxy:
         if args is None:
             args = ()
         self._process = ctx.Process(target=target, args=args, kwargs=kwargs)  # type: ignore
+        # While watch_exit is registered, the loop and sentinel fd it is registered on, and any pending reap retry
+        self._exit_watch: Optional[tuple[asyncio.AbstractEventLoop, int]] = None
+        self._reap_handle: Optional[asyncio.TimerHandle] = None
 
     def start(self) -> None:
         self._process.start()
 
+    def watch_exit(self, callback: Callable[[], None]) -> None:
+        """Call callback from the event loop once the subprocess has exited and been reaped, must be called after start
+
+        The multiprocessing sentinel becomes readable when the process ends, so this needs no polling or SIGCHLD handler
+        """
+        loop = asyncio.get_running_loop()
+        sentinel = self._process.sentinel
+
+        def _reap() -> None:
+            # The pipe closes slightly before the process can be reaped, is_alive reaps it without blocking
+            if self._process.is_alive():
+                self._reap_handle = loop.call_later(0.01, _reap)
+                return
+            self._reap_handle = None
+            callback()
+
+        def _on_exit() -> None:
+            self.unwatch_exit()
+            _reap()
+
+        loop.add_reader(sentinel, _on_exit)
+        self._exit_watch = (loop, sentinel)
+
+    def unwatch_exit(self) -> None:
+        "Undo watch_exit, safe to call if it was never called or has already fired"
+        if self._exit_watch is not None:
+            loop, sentinel = self._exit_watch
+            self._exit_watch = None
+            if not loop.is_closed():
+                loop.remove_reader(sentinel)
+        if self._reap_handle is not None:
+            self._reap_handle.cancel()
+            self._reap_handle = None
+
     def join(self, timeout: Optional[int] = None) -> None:
         if timeout:
             self._process.join(timeout=timeout)
@@ -76,13 +115,6 @@ class ProcessManager:
         self.ctx = multiprocessing.get_context(self.mp_context)
         self.finished_queue: multiprocessing.Queue = self.ctx.Queue()
         self.settings_stash: dict = settings.serialize()  # These are passed to the workers to initialize dispatcher settings
-        self._loop: Optional[asyncio.AbstractEventLoop] = None
-
-    def get_event_loop(self) -> asyncio.AbstractEventLoop:
-        if self._loop:
-            return self._loop
-        self._loop = asyncio.get_event_loop()
-        return self._loop
 
     def create_process(  # type: ignore[no-untyped-def]
         self, args: Optional[Iterable[int | str | dict]] = None, kwargs: Optional[dict] = None, **proxy_kwargs
@@ -95,9 +127,25 @@ class ProcessManager:
         kwargs['finished_queue'] = self.finished_queue
         return ProcessProxy(args=args, kwargs=kwargs, ctx=self.ctx, **proxy_kwargs)
 
-    async def read_finished(self) -> dict[str, Union[str, int]]:
-        message = await self.get_event_loop().run_in_executor(None, self.finished_queue.get)
-        return message
+    def start_finished_reader(self, results: asyncio.Queue) -> threading.Thread:
+        """Starts a thread that forwards messages from finished_queue into the results asyncio queue
+
+        The thread exits after forwarding the administrative stop message.
+        It is a daemon thread, so a reader blocked on an empty finished_queue never holds up exit.
+        """
+        thread = threading.Thread(target=self._forward_finished, args=(asyncio.get_running_loop(), results), name='finished_reader', daemon=True)
+        thread.start()
+        return thread
+
+    def _forward_finished(self, loop: asyncio.AbstractEventLoop, results: asyncio.Queue) -> None:
+        while True:
+            message = self.finished_queue.get()
+            try:
+                loop.call_soon_threadsafe(results.put_nowait, message)
+            except RuntimeError:
+                return  # event loop is closed, nothing is left to read results
+            if message == 'stop':
+                return
 
 
 class ForkServerManager(ProcessManager):
@@ -1,15 +1,17 @@
 import logging
-from typing import Iterable, Iterator, Optional
+from collections import deque
+from typing import Iterator, Optional
 
 from ..protocols import PoolWorker
 from ..protocols import Queuer as QueuerProtocol
+from ..protocols import WorkerData
 
 logger = logging.getLogger(__name__)
 
 
 class Queuer(QueuerProtocol):
-    def __init__(self, workers: Iterable[PoolWorker]) -> None:
-        self.queued_messages: list[dict] = []  # TODO: use deque, customizability
+    def __init__(self, workers: WorkerData) -> None:
+        self.queued_messages: deque[dict] = deque()
         self.workers = workers
 
     def __iter__(self) -> Iterator[dict]:
@@ -19,15 +21,10 @@ class Queuer(QueuerProtocol):
         return len(self.queued_messages)
 
     def get_free_worker(self) -> Optional[PoolWorker]:
-        for candidate_worker in self.workers:
-            if (not candidate_worker.current_task) and candidate_worker.is_ready():
-                return candidate_worker
-        return None
+        return self.workers.get_free_worker()
 
     def running_tasks(self) -> Iterator[dict]:
-        for worker in self.workers:
-            if worker.current_task:
-                yield worker.current_task
+        return self.workers.running_tasks()
 
     def remove_task(self, message: dict) -> None:
         self.queued_messages.remove(message)
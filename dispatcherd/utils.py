@@ -1,6 +1,6 @@
 import importlib
 from enum import Enum
-from typing import Callable, Optional, Protocol, Type, Union, runtime_checkable
+from typing import Any, Callable, Hashable, Optional, Protocol, Type, Union, runtime_checkable
 
 
 @runtime_checkable
@@ -45,6 +45,26 @@ def serialize_task(f: Callable) -> str:
     return MODULE_METHOD_DELIMITER.join([f.__module__, f.__name__])
 
 
+def _freeze(value: Any) -> Hashable:
+    "Convert JSON-like data into an equivalent hashable form, any other value that can not be hashed is compared by its repr"
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return ('<unhashable>', type(value).__qualname__, repr(value))
+    return value
+
+
+def task_signature(message: dict) -> tuple:
+    """Hashable identity of a task for duplicate detection, two messages with the same task, args, and kwargs are duplicates"""
+    return (message.get('task'), _freeze(message.get('args')), _freeze(message.get('kwargs')))
+
+
 class DuplicateBehavior(Enum):
     parallel = 'parallel'  # run multiple versions of same task at same time
     discard = 'discard'  # if task is submitted twice, discard the 2nd one
@@ -4,6 +4,7 @@ from typing import AsyncIterator, Callable
 
 import pytest
 import pytest_asyncio
+from psycopg import sql
 
 from dispatcherd.brokers.pg_notify import Broker, acreate_connection, connection_save
 from dispatcherd.config import DispatcherSettings
@@ -143,11 +144,21 @@ async def psycopg_conn():
 
 @pytest_asyncio.fixture(loop_scope="function", scope="function")
 async def pg_message(psycopg_conn) -> Callable:
+    # Note on weirdness here, this broker will only be used for async publishing, so we give junk for synchronous connection
+    broker = Broker(async_connection=psycopg_conn, default_publish_channel='test_channel', sync_connection_factory='tests.data.methods.something')
+
     async def _rf(message, channel=None):
-        # Note on weirdness here, this broker will only be used for async publishing, so we give junk for synchronous connection
-        broker = Broker(async_connection=psycopg_conn, default_publish_channel='test_channel', sync_connection_factory='tests.data.methods.something')
         await broker.apublish_message(channel=channel, message=message)
 
+    async def _many(messages, channel='test_channel'):
+        """Send all messages in one round trip
+
+        Each NOTIFY gets its own transaction, because postgres folds identical payloads sent to one channel in one transaction
+        """
+        query = sql.SQL(' ').join(sql.SQL('BEGIN; NOTIFY {}, {}; COMMIT;').format(sql.Identifier(channel), sql.Literal(message)) for message in messages)
+        await psycopg_conn.execute(query)
+
+    _rf.many = _many
     return _rf
 
 
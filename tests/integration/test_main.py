@@ -1,6 +1,5 @@
 import asyncio
 import json
-import time
 from typing import Union
 
 import pytest
@@ -9,17 +8,24 @@ from dispatcherd.config import temporary_settings
 from tests.data import methods as test_methods
 
 SLEEP_METHOD = 'lambda: __import__("time").sleep(0.1)'
+DISCARD_MESSAGES = tuple(json.dumps({'task': 'lambda: __import__("time").sleep(9)', 'on_duplicate': 'discard', 'uuid': f'dscd-{i}'}) for i in range(10))
 
 
-async def wait_to_receive(dispatcher, ct, timeout=5.0, interval=0.05):
-    """Poll for the dispatcher to have received a certain ct of messages"""
-    start = time.time()
-    while time.time() - start < timeout:
-        if dispatcher.pool.received_count >= ct:
-            break
-        await asyncio.sleep(interval)
-    else:
-        raise RuntimeError(f'Failed to receive expected {ct} messages {dispatcher.pool.received_count}')
+async def wait_to_receive(dispatcher, ct, timeout=5.0):
+    """Wait for the dispatcher to have received a certain ct of messages"""
+    pool = dispatcher.pool
+
+    async def _received():
+        while True:
+            pool.events.message_received.clear()  # before the check, so a message received after the check wakes us
+            if pool.received_count >= ct:
+                return
+            await pool.events.message_received.wait()
+
+    try:
+        await asyncio.wait_for(_received(), timeout=timeout)
+    except asyncio.TimeoutError:
+        raise RuntimeError(f'Failed to receive expected {ct} messages {pool.received_count}')
 
 
 @pytest.mark.asyncio
@@ -81,25 +87,37 @@ async def test_multiple_channels(apg_dispatcher, pg_message):
 @pytest.mark.asyncio
 async def test_ten_messages_queued(apg_dispatcher, pg_message):
     clearing_task = asyncio.create_task(apg_dispatcher.pool.events.work_cleared.wait())
-    await asyncio.gather(*[pg_message(SLEEP_METHOD) for i in range(15)])
+    await pg_message.many([SLEEP_METHOD for i in range(15)])
     await asyncio.wait_for(clearing_task, timeout=3)
 
     assert apg_dispatcher.pool.finished_count == 15
 
 
+def arm_delay_watch(dispatcher, uuid: str) -> asyncio.Event:
+    "Return an event that is set once the dispatcher has scheduled the delayed task with this uuid"
+    armed = asyncio.Event()
+    create_delayed_task = dispatcher.create_delayed_task
+
+    async def _create_and_signal(message: dict) -> None:
+        await create_delayed_task(message)
+        if message.get('uuid') == uuid:
+            armed.set()
+
+    dispatcher.create_delayed_task = _create_and_signal
+    return armed
+
+
 def get_worker_data(response_list: list[dict[str, Union[str, dict]]]) -> dict:
     "Given some control-and-response data, assuming 1 node, 1 entry, get the task message"
     assert len(response_list) == 1
-    response = response_list[0].copy()
-    response.pop('node_id', None)
-    assert len(response) == 1
-    return list(response.values())[0]
+    values = [value for key, value in response_list[0].items() if key != 'node_id']
+    assert len(values) == 1
+    return values[0]
 
 
 @pytest.mark.asyncio
-async def test_get_running_jobs(apg_dispatcher, pg_message, pg_control):
-    msg = json.dumps({'task': 'lambda: __import__("time").sleep(3.1415)', 'uuid': 'find_me'})
-    await pg_message(msg)
+async def test_get_running_jobs(apg_dispatcher, pg_control, test_settings):
+    test_methods.sleep_function.apply_async(args=[3.1415], uuid='find_me', settings=test_settings)
 
     clearing_task = asyncio.create_task(apg_dispatcher.pool.events.work_cleared.wait())
     running_jobs = await asyncio.wait_for(pg_control.acontrol_with_reply('running', timeout=1), timeout=5)
@@ -109,9 +127,8 @@ async def test_get_running_jobs(apg_dispatcher, pg_message, pg_control):
 
 
 @pytest.mark.asyncio
-async def test_cancel_task(apg_dispatcher, pg_message, pg_control):
-    msg = json.dumps({'task': 'lambda: __import__("time").sleep(3.1415)', 'uuid': 'foobar'})
-    await pg_message(msg)
+async def test_cancel_task(apg_dispatcher, pg_control, test_settings):
+    test_methods.sleep_function.apply_async(args=[3.1415], uuid='foobar', settings=test_settings)
 
     clearing_task = asyncio.create_task(apg_dispatcher.pool.events.work_cleared.wait())
     await asyncio.sleep(0.2)
@@ -128,10 +145,11 @@ async def test_cancel_task(apg_dispatcher, pg_message, pg_control):
 async def test_message_with_delay(apg_dispatcher, pg_message, pg_control):
     # Send message to run task with a delay
     msg = json.dumps({'task': 'lambda: print("This task had a delay")', 'uuid': 'delay_task', 'delay': 0.3})
+    delay_armed = arm_delay_watch(apg_dispatcher, 'delay_task')
     await pg_message(msg)
 
     # Make assertions while task is in the delaying phase
-    await asyncio.sleep(0.04)
+    await asyncio.wait_for(delay_armed.wait(), timeout=1)
     running_jobs = await asyncio.wait_for(pg_control.acontrol_with_reply('running', timeout=1), timeout=5)
     running_job = get_worker_data(running_jobs)
     assert running_job['uuid'] == 'delay_task'
@@ -147,10 +165,11 @@ async def test_message_with_delay(apg_dispatcher, pg_message, pg_control):
 async def test_cancel_delayed_task(apg_dispatcher, pg_message, pg_control):
     # Send message to run task with a delay
     msg = json.dumps({'task': 'lambda: print("This task should be canceled before start")', 'uuid': 'delay_task_will_cancel', 'delay': 0.8})
+    delay_armed = arm_delay_watch(apg_dispatcher, 'delay_task_will_cancel')
     await pg_message(msg)
 
     # Make assertions while task is in the delaying phase
-    await asyncio.sleep(0.04)
+    await asyncio.wait_for(delay_armed.wait(), timeout=1)
     canceled_jobs = await asyncio.wait_for(pg_control.acontrol_with_reply('cancel', data={'uuid': 'delay_task_will_cancel'}, timeout=1), timeout=5)
     canceled_job = get_worker_data(canceled_jobs)
     assert canceled_job['uuid'] == 'delay_task_will_cancel'
@@ -165,11 +184,13 @@ async def test_cancel_delayed_task(apg_dispatcher, pg_message, pg_control):
 async def test_cancel_with_no_reply(apg_dispatcher, pg_message, pg_control):
     # Send message to run task with a delay
     msg = json.dumps({'task': 'lambda: print("This task should be canceled before start")', 'uuid': 'delay_task_will_cancel', 'delay': 2.0})
+    delay_armed = arm_delay_watch(apg_dispatcher, 'delay_task_will_cancel')
     await pg_message(msg)
 
     # Make assertions while task is in the delaying phase
+    await asyncio.wait_for(delay_armed.wait(), timeout=1)
+    # control messages on the channel are processed in order, so the running query below sees the cancel
     await pg_control.acontrol('cancel', data={'uuid': 'delay_task_will_cancel'})
-    await asyncio.sleep(0.04)
 
     running_jobs = await asyncio.wait_for(pg_control.acontrol_with_reply('running', timeout=1), timeout=5)
     assert list(running_jobs[0].keys()) == ['node_id']
@@ -207,9 +228,7 @@ async def test_aio_tasks(apg_dispatcher, pg_control):
 
 @pytest.mark.asyncio
 async def test_task_discard(apg_dispatcher, pg_message):
-    messages = [json.dumps({'task': 'lambda: __import__("time").sleep(9)', 'on_duplicate': 'discard', 'uuid': f'dscd-{i}'}) for i in range(10)]
-
-    await asyncio.gather(*[pg_message(msg) for msg in messages])
+    await pg_message.many(DISCARD_MESSAGES)
 
     await wait_to_receive(apg_dispatcher, 10)
 
@@ -0,0 +1,70 @@
+from dispatcherd.service.blocker import Blocker
+from dispatcherd.service.pool import PoolWorker, WorkerData
+from dispatcherd.service.queuer import Queuer
+from dispatcherd.utils import task_signature
+
+
+class FakeProcess:
+    pid = None
+
+
+def make_blocker() -> tuple[Blocker, WorkerData]:
+    workers = WorkerData()
+    worker = PoolWorker(0, FakeProcess())
+    worker.status = 'ready'
+    workers.add_worker(worker)
+    return Blocker(Queuer(workers)), workers
+
+
+def test_task_signature_ignores_other_keys():
+    message = {'task': 'foo.bar', 'args': [1, [2]], 'kwargs': {'a': {'b': 1}}, 'uuid': 'one'}
+    other = {'task': 'foo.bar', 'args': [1, [2]], 'kwargs': {'a': {'b': 1}}, 'uuid': 'two', 'on_duplicate': 'serial'}
+    assert task_signature(message) == task_signature(other)
+    assert task_signature(message) != task_signature({'task': 'foo.bar', 'args': [1, [3]], 'kwargs': {'a': {'b': 1}}})
+
+
+class Unhashable:
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return 'Unhashable()'
+
+
+def test_task_signature_with_unhashable_kwargs():
+    message = {'task': 'foo.bar', 'kwargs': {'tags': [{'a', 'b'}], 'obj': Unhashable()}, 'uuid': 'one'}
+    assert task_signature(message) == task_signature(dict(message, kwargs={'tags': [{'b', 'a'}], 'obj': Unhashable()}))
+    assert task_signature(message) != task_signature(dict(message, kwargs={'tags': [{'a'}], 'obj': Unhashable()}))
+
+    blocker, _ = make_blocker()
+    assert blocker.process_task(message) is message
+    assert blocker.process_task(dict(message, uuid='two', on_duplicate='serial')) is not None
+
+
+def test_serial_task_blocked_while_running():
+    blocker, workers = make_blocker()
+    message = {'task': 'foo.bar', 'args': [1], 'on_duplicate': 'serial', 'uuid': 'first'}
+    assert blocker.process_task(message) is message
+    workers.get_by_id(0).current_task = message
+
+    duplicate = dict(message, uuid='second')
+    assert blocker.process_task(duplicate) is None
+    assert blocker.count() == 1
+    assert blocker.pop_unblocked_messages() == []
+
+    workers.get_by_id(0).mark_finished_task()
+    assert blocker.pop_unblocked_messages() == [duplicate]
+    assert blocker.count() == 0
+    assert not blocker.already_queued(message)
+
+
+def test_queue_one_discards_extra_duplicates():
+    blocker, workers = make_blocker()
+    message = {'task': 'foo.bar', 'on_duplicate': 'queue_one'}
+    workers.get_by_id(0).current_task = message
+
+    assert blocker.process_task(dict(message, uuid='queued')) is None
+    assert blocker.process_task(dict(message, uuid='discarded')) is None
+    assert [blocker.count(), blocker.discard_count] == [1, 1]
+
+    blocker.remove_task(dict(message, uuid='queued'))
+    assert not blocker.already_queued(message)
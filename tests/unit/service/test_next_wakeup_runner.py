@@ -119,3 +119,25 @@ async def test_graceful_shutdown():
     callback.assert_called_once_with()
 
     assert runner.asyncio_task.done() is True
+
+
+@pytest.mark.asyncio
+async def test_kick_running_task_does_not_scan():
+    objects = set()
+    obj = ObjectWithWakeup(1)
+    objects.add(obj)
+    callback = mock.MagicMock()
+
+    runner = NextWakeupRunner(objects, callback)
+    await runner.kick()  # creates the task
+    task = runner.asyncio_task
+    assert task is not None
+
+    with mock.patch.object(runner, 'process_wakeups') as process_wakeups:
+        await runner.kick()
+    process_wakeups.assert_not_called()
+    assert runner.kick_event.is_set()
+    assert runner.asyncio_task is task
+
+    await runner.shutdown()
+    await task
@@ -4,7 +4,7 @@ from unittest import mock
 
 import pytest
 
-from dispatcherd.service.pool import WorkerPool
+from dispatcherd.service.pool import PoolEvents, WorkerPool
 from dispatcherd.service.process import ProcessManager
 
 
@@ -117,3 +117,162 @@ async def test_error_while_scaling_up(test_settings):
         await pool.manage_new_workers(asyncio.Lock())
 
     assert set([worker.status for worker in pool.workers]) == {'error'}
+
+
+@pytest.mark.asyncio
+async def test_worker_counts_follow_state_changes(test_settings):
+    "Counts used for scaling decisions are kept by the workers, and must agree with the actual worker states"
+    pm = ProcessManager(settings=test_settings)
+    pool = WorkerPool(pm, min_workers=3, max_workers=3)
+    await pool.scale_workers()
+    assert pool.workers.capacity_count == 3
+    assert not pool.workers.all_ready
+
+    for worker in pool.workers:
+        worker.status = 'ready'
+    assert pool.workers.all_ready
+
+    worker = pool.workers.get_by_id(0)
+    worker.current_task = {'task': 'waiting.task'}
+    assert pool.get_running_count() == 1
+    assert list(pool.queuer.running_tasks()) == [{'task': 'waiting.task'}]
+    worker.mark_finished_task()
+    assert pool.get_running_count() == 0
+    assert list(pool.queuer.running_tasks()) == []
+
+    worker.status = 'error'
+    assert pool.workers.capacity_count == 2
+    pool.workers.remove_by_id(0)
+    assert pool.workers.capacity_count == 2
+    assert pool.workers.all_ready
+
+
+@pytest.mark.asyncio
+async def test_free_worker_follows_worker_lifecycle(test_settings):
+    "The free worker index must track a worker from ready, to busy, to finished, to stopped and removed"
+    pm = ProcessManager(settings=test_settings)
+    pool = WorkerPool(pm, min_workers=1, max_workers=1)
+    await pool.up()
+    worker = pool.workers.get_by_id(0)
+    assert pool.queuer.get_free_worker() is None  # initialized, not ready yet
+
+    worker.status = 'ready'
+    assert pool.queuer.get_free_worker() is worker
+
+    worker.current_task = {'task': 'waiting.task'}
+    assert pool.queuer.get_free_worker() is None
+
+    worker.mark_finished_task()
+    assert pool.queuer.get_free_worker() is worker
+
+    worker.status = 'stopping'
+    assert pool.queuer.get_free_worker() is None
+
+    worker.status = 'ready'
+    pool.workers.remove_by_id(0)
+    assert pool.queuer.get_free_worker() is None
+
+
+@pytest.mark.asyncio
+async def test_management_wakes_for_next_deadline(test_settings):
+    "The management task should wake up for the soonest worker deadline, not only every scaledown_interval"
+    pm = ProcessManager(settings=test_settings)
+    pool = WorkerPool(pm, min_workers=1, max_workers=3, scaledown_interval=15.0, worker_stop_wait=5.0, worker_removal_wait=2.0)
+    assert pool.next_management_timeout() == pytest.approx(15.0, abs=0.1)
+
+    await pool.up()
+    worker = pool.workers.get_by_id(0)
+    worker.status = 'stopping'
+    worker.stopping_at = time.monotonic()
+    assert pool.next_management_timeout() == pytest.approx(5.0, abs=0.1)
+
+    worker.status = 'retired'
+    worker.retired_at = time.monotonic() - 10.0
+    # Already due when the last pass ran, so that pass handled it
+    assert pool.next_management_timeout() == pytest.approx(15.0, abs=0.1)
+    # Came due after the last pass started, so run another pass now
+    assert pool.next_management_timeout(handled_at=time.monotonic() - 60.0) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_overdue_scale_down_that_can_not_happen_does_not_spin(test_settings):
+    "At max workers with queue pressure, nothing can be scaled down, so an old last_used time must not wake management in a loop"
+    pm = ProcessManager(settings=test_settings)
+    pool = WorkerPool(pm, min_workers=1, max_workers=2, scaledown_wait=15.0, scaledown_interval=15.0)
+    for worker_id in range(2):
+        await pool.up()
+        pool.workers.get_by_id(worker_id).process.is_alive = lambda: True  # never started, pretend they are running
+    busy_worker = pool.workers.get_by_id(0)
+    busy_worker.status = 'ready'
+    busy_worker.current_task = {'task': 'lambda: None', 'uuid': 'busy'}
+    pool.workers.get_by_id(1).status = 'starting'
+    pool.queuer.queued_messages.extend([{'task': 'lambda: None', 'uuid': f'queued-{i}'} for i in range(2)])
+    pool.last_used_by_ct[2] = time.monotonic() - 100.0
+
+    passes = 0
+    scale_workers = pool.scale_workers
+
+    async def counting_scale_workers():
+        nonlocal passes
+        passes += 1
+        await scale_workers()
+
+    pool.scale_workers = counting_scale_workers
+    management_task = asyncio.create_task(pool.manage_workers(asyncio.Lock()))
+    await asyncio.sleep(0.2)
+    pool.shutting_down = True
+    pool.events.kick_management('shutdown')
+    await asyncio.wait_for(management_task, timeout=1)
+
+    assert passes <= 2
+
+
+def test_management_kicks_are_coalesced():
+    events = PoolEvents()
+    events.kick_management('queue_pressure')
+    events.kick_management('queue_pressure')
+    events.kick_management('exit')
+    assert events.management_event.is_set()
+    assert events.management_reasons == {'queue_pressure', 'exit'}
+
+
+@pytest.mark.asyncio
+async def test_dispatch_sets_message_received(test_settings):
+    pm = ProcessManager(settings=test_settings)
+    pool = WorkerPool(pm, min_workers=0, max_workers=0)
+    assert not pool.events.message_received.is_set()
+    await pool.dispatch_task({'task': 'lambda: None', 'uuid': 'foo'})
+    assert pool.events.message_received.is_set()
+    assert pool.received_count == 1
+
+
+@pytest.mark.asyncio
+async def test_worker_stop_waits_for_shutdown_message(test_settings):
+    pm = ProcessManager(settings=test_settings)
+    pool = WorkerPool(pm, min_workers=1, max_workers=1)
+    await pool.up()
+    worker = pool.workers.get_by_id(0)
+    worker.status = 'stopping'
+
+    wait_task = asyncio.create_task(worker.wait_for_exit())
+    await asyncio.sleep(0)
+    assert not wait_task.done()
+
+    await pool.process_result({'worker': 0, 'event': 'shutdown'})
+    await asyncio.wait_for(wait_task, timeout=1)
+    assert worker.status == 'exited'
+
+
+@pytest.mark.asyncio
+async def test_worker_timeout_deadline(test_settings):
+    pm = ProcessManager(settings=test_settings)
+    pool = WorkerPool(pm, min_workers=1, max_workers=1)
+    await pool.up()
+    worker = pool.workers.get_by_id(0)
+    assert worker.next_wakeup() is None
+
+    await worker.start_task({'task': 'waiting.task', 'timeout': 5})
+    assert worker.next_wakeup() == pytest.approx(time.monotonic() + 5, abs=0.1)
+
+    worker.mark_finished_task()
+    assert worker.next_wakeup() is None
@@ -1,4 +1,6 @@
+import asyncio
 import os
+import threading
 from multiprocessing import Queue
 
 import pytest
@@ -69,3 +71,56 @@ def test_pid_is_correct(manager_cls, test_settings):
 
     msg = process_manager.finished_queue.get()
     assert int(msg) == process.pid
+
+
+def sleep_until_killed(settings, finished_queue, message_queue):
+    message_queue.get()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('manager_cls', [ProcessManager, ForkServerManager])
+async def test_watch_exit_calls_back_when_process_dies(manager_cls, test_settings):
+    process_manager = manager_cls(settings=test_settings)
+    process = process_manager.create_process((), target=sleep_until_killed)
+    process.start()
+    exited = asyncio.Event()
+    process.watch_exit(exited.set)
+
+    process.kill()
+    await asyncio.wait_for(exited.wait(), timeout=3)
+    assert not process.is_alive()
+
+
+
+@pytest.mark.asyncio
+async def test_unwatch_exit_removes_reader(test_settings):
+    process_manager = ProcessManager(settings=test_settings)
+    process = process_manager.create_process((), target=sleep_until_killed)
+    process.start()
+    exited = asyncio.Event()
+    process.watch_exit(exited.set)
+    process.unwatch_exit()
+
+    process.kill()
+    process.join()
+    await asyncio.sleep(0.05)
+    assert not exited.is_set()
+    assert not asyncio.get_running_loop().remove_reader(process._process.sentinel)  # nothing left registered
+
+
+def exit_right_away(settings, finished_queue, message_queue):
+    return
+
+
+def test_large_message_to_dead_worker_does_not_block(test_settings):
+    process_manager = ProcessManager(settings=test_settings)
+    process = process_manager.create_process((), target=exit_right_away)
+    process.start()
+    process.join()
+
+    # Larger than the pipe buffer, and nothing will ever read it
+    put_thread = threading.Thread(target=process.message_queue.put, args=('x' * 200_000,), daemon=True)
+    put_thread.start()
+    put_thread.join(timeout=2)
+    assert not put_thread.is_alive()
+    process.message_queue.cancel_join_thread()  # the feeder thread stays blocked on the pipe, do not wait for it at exit
@@ -17,11 +17,19 @@ async def test_detect_unexpectedly_dead_worker(test_settings, caplog):
     # Create a pool with one worker and start it
     pm = ProcessManager(settings=test_settings)
     pool = WorkerPool(pm, min_workers=1, max_workers=5)
+    exited = asyncio.Event()
+    kick_management = pool.worker_process_exited
+
+    def worker_process_exited():
+        kick_management()
+        exited.set()
+
+    pool.worker_process_exited = worker_process_exited
     await pool.start_working(asyncio.Lock())
     await pool.events.workers_ready.wait()
 
     # Get the ready worker and assign a task
-    worker = list(pool.workers)[0]
+    worker = next(iter(pool.workers))
     worker.current_task = {'uuid': 'test-task-123'}
     worker_pid = worker.process.pid
     assert worker_pid is not None, "Worker process PID should not be None"
@@ -29,7 +37,7 @@ async def test_detect_unexpectedly_dead_worker(test_settings, caplog):
     # Directly kill the worker's process using kill(), which sends SIGKILL
     with caplog.at_level("ERROR"):
         worker.process.kill()
-        await asyncio.sleep(0.1)  # Allow time for the kill to be registered
+        await asyncio.wait_for(exited.wait(), timeout=1)
         await pool.manage_old_workers()
 
     # Verify that the worker's status is updated and the cancellation counter incremented
@@ -40,9 +48,8 @@ async def test_detect_unexpectedly_dead_worker(test_settings, caplog):
     assert "test-task-123" in caplog.text
 
     # Clean up by shutting down the pool (override cancel to prevent errors)
-    for w in pool.workers:
-        w.cancel = lambda: None
-    await pool.shutdown()
+    with mock.patch('dispatcherd.service.pool.PoolWorker.cancel', lambda self: None):
+        await pool.shutdown()
 
 
 @pytest.mark.asyncio
@@ -84,10 +91,30 @@ async def test_dead_worker_with_no_task(test_settings):
 
     initial_canceled = pool.canceled_count
 
-    with mock.patch.object(worker.process, 'is_alive', return_value=False):
-        await pool.manage_old_workers()
+    worker.process.is_alive = lambda: False  # the process was never started, report it as dead
+    await pool.manage_old_workers()
 
     # Assert that the worker status is marked as error.
     assert worker.status == 'error'
     # And the canceled counter remains unchanged since there was no running task.
     assert pool.canceled_count == initial_canceled
+
+
+@pytest.mark.asyncio
+async def test_worker_death_kicks_management(test_settings):
+    """
+    Verify that a worker process exiting wakes the management task right away, instead of waiting for its next poll.
+    """
+    pm = ProcessManager(settings=test_settings)
+    pool = WorkerPool(pm, min_workers=1, max_workers=3)
+    await pool.up()
+    await pool.manage_new_workers(asyncio.Lock())
+    worker = pool.workers.get_by_id(0)
+    assert not pool.events.management_event.is_set()
+
+    worker.process.kill()
+    await asyncio.wait_for(pool.events.management_event.wait(), timeout=1)
+    assert 'worker_exit' in pool.events.management_reasons
+
+    await pool.manage_old_workers()
+    assert worker.status == 'error'